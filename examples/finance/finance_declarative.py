@@ -0,0 +1,11 @@
+from lumos.ga import Ga
+
+
+def main():
+    ga = Ga(config_file="configs_finance_declarative.toml", f_obj=None)
+    result = ga.optimize()
+    print(result)
+
+
+if __name__ == "__main__":
+    main()
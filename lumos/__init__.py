@@ -1,2 +1,3 @@
 import lumos.ga
 from lumos.ga import Ga
+from lumos.sweep import Sweep
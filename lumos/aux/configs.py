@@ -1,16 +1,36 @@
+import copy
 import toml
 
 
 class Configs:
-    def __init__(self, toml_file_name):
+    def __init__(self, toml_file_name, overrides=None):
 
-        try:
-            with open(toml_file_name, "r") as config_file:
-                self.configs_from_toml = toml.load(config_file)
-        except Exception as ex:
-            raise RuntimeError(
-                f"Falha no carregamento do arquivo de configurações ({ex})."
-            )
+        # As configurações também podem ser fornecidas diretamente (dicionário com a estrutura do arquivo TOML)
+        if isinstance(toml_file_name, dict):
+            self.configs_from_toml = copy.deepcopy(toml_file_name)
+        else:
+            try:
+                with open(toml_file_name, "r") as config_file:
+                    self.configs_from_toml = toml.load(config_file)
+            except Exception as ex:
+                raise RuntimeError(
+                    f"Falha no carregamento do arquivo de configurações ({ex})."
+                )
+
+        # Sobrescrita de parâmetros (ex.: {"pop_len": 50, "crossover.alpha": 0.2})
+        if overrides is not None:
+            for key, value in overrides.items():
+                if "." in key:
+                    group_name, var_name = key.split(".", 1)
+                    self.set_config(value, var_name, group_name)
+                else:
+                    self.set_config(value, key)
+
+    def set_config(self, value, var_name, group_name=None):
+        if group_name is None:
+            self.configs_from_toml[var_name] = value
+        else:
+            self.configs_from_toml.setdefault(group_name, {})[var_name] = value
 
     def config_exists(self, var_name, group_name=None):
         try:
@@ -0,0 +1,191 @@
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from loguru import logger
+import numpy as np
+
+
+# Função objetivo empregada pelos processos do pool (definida na inicialização de cada processo)
+worker_f_obj = None
+
+
+def get_available_evaluation_backends():
+    return {
+        "serial": serial,
+        "vectorized": vectorized,
+        "thread": thread,
+        "process": process,
+    }
+
+
+def serial(ga_data, pop):
+    return evaluate_rows(ga_data.f_obj, pop)
+
+
+def vectorized(ga_data, pop):
+    # A função objetivo recebe a população transposta (x[j] contém o gene j de todos os indivíduos)
+    return np.broadcast_to(
+        np.asarray(ga_data.f_obj(pop.T), dtype=float), pop.shape[0]
+    ).copy()
+
+
+def thread(ga_data, pop):
+    executor = get_executor(ga_data, "thread")
+    chunks = split_rows(pop, ga_data.evaluation_chunk_size, ga_data.evaluation_workers)
+    return np.concatenate(
+        list(executor.map(evaluate_rows, [ga_data.f_obj] * len(chunks), chunks))
+    )
+
+
+def process(ga_data, pop):
+    executor = get_executor(ga_data, "process")
+    chunks = split_rows(pop, ga_data.evaluation_chunk_size, ga_data.evaluation_workers)
+    return np.concatenate(list(executor.map(evaluate_rows_in_worker, chunks)))
+
+
+def evaluate_rows(f_obj, pop):
+    return np.array([f_obj(x) for x in pop], dtype=float).reshape(pop.shape[0])
+
+
+def init_worker(f_obj):
+    global worker_f_obj
+    worker_f_obj = f_obj
+
+
+def evaluate_rows_in_worker(pop):
+    return evaluate_rows(worker_f_obj, pop)
+
+
+def split_rows(pop, chunk_size, workers):
+    # Sem um tamanho de lote definido, a população é dividida igualmente entre os workers
+    if chunk_size is None:
+        chunk_size = np.ceil(pop.shape[0] / max(1, workers))
+    chunk_size = max(1, int(chunk_size))
+    return [pop[i : i + chunk_size] for i in range(0, pop.shape[0], chunk_size)]
+
+
+def get_executor(ga_data, kind):
+    if kind not in ga_data.evaluation_executors:
+        if kind == "thread":
+            ga_data.evaluation_executors[kind] = ThreadPoolExecutor(
+                max_workers=ga_data.evaluation_workers
+            )
+        else:
+            ga_data.evaluation_executors[kind] = ProcessPoolExecutor(
+                max_workers=ga_data.evaluation_workers,
+                initializer=init_worker,
+                initargs=(ga_data.f_obj,),
+            )
+    return ga_data.evaluation_executors[kind]
+
+
+def close_executors(ga_data):
+    for executor in ga_data.evaluation_executors.values():
+        executor.shutdown(wait=True, cancel_futures=True)
+    ga_data.evaluation_executors = {}
+
+
+def get_dispatch_overhead(ga_data, kind):
+    # Tempo de ida e volta de uma tarefa trivial (o custo de criação do pool não é contabilizado)
+    executor = get_executor(ga_data, kind)
+    executor.submit(len, ()).result()
+    start = time.perf_counter()
+    for future in [executor.submit(len, ()) for _ in range(ga_data.evaluation_workers)]:
+        future.result()
+    return (time.perf_counter() - start) / ga_data.evaluation_workers
+
+
+def autotune(ga_data, pop):
+    logger.info(
+        "Iniciando seleção automática do método de avaliação da função objetivo."
+    )
+    backends = get_available_evaluation_backends()
+    n = pop.shape[0]
+    f_values = np.empty(n)
+    costs = {}
+
+    # Avaliação serial de uma fração da população
+    segment = min(n, max(2, int(np.ceil(n / 8))))
+    start = time.perf_counter()
+    f_values[:segment] = serial(ga_data, pop[:segment])
+    costs["serial"] = (time.perf_counter() - start) / segment
+    evaluated = segment
+
+    # Avaliação vetorizada (apenas quando o usuário informa que a função objetivo a suporta)
+    if evaluated < n and ga_data.vectorized_f_obj:
+        end = min(n, evaluated + segment)
+        try:
+            start = time.perf_counter()
+            f_values[evaluated:end] = vectorized(ga_data, pop[evaluated:end])
+            costs["vectorized"] = (time.perf_counter() - start) / (end - evaluated)
+            evaluated = end
+        except Exception as ex:
+            logger.info(f'Método de avaliação "vectorized" indisponível ({ex}).')
+
+    # Avaliação paralela (apenas quando há mais de um worker e o custo da avaliação serial da população justifica
+    # o custo dos pools)
+    if (
+        ga_data.evaluation_workers > 1
+        and costs["serial"] * n >= ga_data.autotune_min_parallel_seconds
+    ):
+        for kind in ("thread", "process"):
+            segment = max(2 * ga_data.evaluation_workers, int(np.ceil(n / 8)))
+            if n - evaluated < segment:
+                break
+            try:
+                dispatch_overhead = get_dispatch_overhead(ga_data, kind)
+                ga_data.evaluation_chunk_size = get_chunk_size(
+                    ga_data, costs["serial"], dispatch_overhead, segment
+                )
+                start = time.perf_counter()
+                f_values[evaluated : evaluated + segment] = backends[kind](
+                    ga_data, pop[evaluated : evaluated + segment]
+                )
+                costs[kind] = (time.perf_counter() - start) / segment
+                evaluated += segment
+            except Exception as ex:
+                logger.info(f'Método de avaliação "{kind}" indisponível ({ex}).')
+
+    backend = min(costs, key=costs.get)
+    if backend in ("thread", "process"):
+        dispatch_overhead = get_dispatch_overhead(ga_data, backend)
+        ga_data.evaluation_chunk_size = get_chunk_size(
+            ga_data, costs["serial"], dispatch_overhead, n
+        )
+    f_values[evaluated:] = backends[backend](ga_data, pop[evaluated:])
+
+    ga_data.selected_evaluation_backend = backend
+    ga_data.evaluation_cost = None
+    ga_data.evaluation_tuned_gen = ga_data.gen
+    logger.info(
+        "Custo por indivíduo de cada método de avaliação: "
+        + ", ".join(f"{kind}: {cost * 1e6:.1f} us" for kind, cost in costs.items())
+        + "."
+    )
+    logger.info(
+        f'Método de avaliação selecionado: "{backend}"'
+        + (
+            f" ({ga_data.evaluation_workers} workers, lotes de {ga_data.evaluation_chunk_size} indivíduos)."
+            if backend in ("thread", "process")
+            else "."
+        )
+    )
+    return f_values
+
+
+def get_chunk_size(ga_data, serial_cost, dispatch_overhead, n):
+    if ga_data.configs.config_exists("evaluation_chunk_size"):
+        return ga_data.configs.get_config("evaluation_chunk_size")
+
+    # Lotes grandes o suficiente para que o custo de despacho seja inferior a 10% do custo da avaliação, mas
+    # pequenos o suficiente para que todos os workers sejam ocupados
+    chunk_size = int(np.ceil(dispatch_overhead / (0.1 * max(serial_cost, 1e-9))))
+    return int(np.clip(chunk_size, 1, int(np.ceil(n / ga_data.evaluation_workers))))
+
+
+def get_default_workers():
+    # Processos pertencentes a um pool (varredura de parâmetros ou serviço) não criam pools adicionais
+    if multiprocessing.parent_process() is not None:
+        return 1
+    return os.cpu_count() or 1
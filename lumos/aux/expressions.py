@@ -0,0 +1,298 @@
+import ast
+from collections import Counter
+import numpy as np
+
+
+# Funções e constantes que podem ser empregadas nas expressões definidas no arquivo de configurações
+AVAILABLE_FUNCTIONS = {
+    "abs": np.abs,
+    "sqrt": np.sqrt,
+    "exp": np.exp,
+    "log": np.log,
+    "log10": np.log10,
+    "sin": np.sin,
+    "cos": np.cos,
+    "tan": np.tan,
+    "arcsin": np.arcsin,
+    "arccos": np.arccos,
+    "arctan": np.arctan,
+    "sinh": np.sinh,
+    "cosh": np.cosh,
+    "tanh": np.tanh,
+    "deg2rad": np.deg2rad,
+    "rad2deg": np.rad2deg,
+    "minimum": np.minimum,
+    "maximum": np.maximum,
+}
+AVAILABLE_CONSTANTS = {"pi": np.pi, "e": np.e}
+
+AVAILABLE_OPERATORS = {
+    ast.Add: "+",
+    ast.Sub: "-",
+    ast.Mult: "*",
+    ast.Div: "/",
+    ast.Pow: "**",
+    ast.Mod: "%",
+    ast.FloorDiv: "//",
+    ast.UAdd: "+",
+    ast.USub: "-",
+}
+
+# Maior expoente literal permitido no operador "**"
+MAX_EXPONENT = 100
+
+
+def parse_expression(expression, names, x_len):
+    try:
+        tree = ast.parse(str(expression).strip(), mode="eval").body
+    except SyntaxError as ex:
+        raise RuntimeError(f'Expressão "{expression}" inválida ({ex}).')
+
+    # Nomes que podem ser empregados apenas como "x" indexado ou como função chamada
+    indexed_names = [
+        node.value for node in ast.walk(tree) if isinstance(node, ast.Subscript)
+    ]
+    called_names = [node.func for node in ast.walk(tree) if isinstance(node, ast.Call)]
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.BinOp, ast.UnaryOp)):
+            if type(node.op) not in AVAILABLE_OPERATORS:
+                raise RuntimeError(
+                    f'Operador não permitido na expressão "{expression}".'
+                )
+            exponent = (
+                get_literal_value(node.right) if isinstance(node.op, ast.Pow) else None
+            )
+            if exponent is not None and abs(exponent) > MAX_EXPONENT:
+                raise RuntimeError(
+                    f'Expoentes maiores do que {MAX_EXPONENT} (em módulo) não são permitidos na expressão "{expression}".'
+                )
+        elif isinstance(node, ast.Call):
+            if (
+                not isinstance(node.func, ast.Name)
+                or node.func.id not in AVAILABLE_FUNCTIONS
+                or node.keywords
+            ):
+                raise RuntimeError(
+                    f'Chamada de função não permitida na expressão "{expression}".'
+                )
+        elif isinstance(node, ast.Subscript):
+            if (
+                not isinstance(node.value, ast.Name)
+                or node.value.id != "x"
+                or not isinstance(node.slice, ast.Constant)
+                or not isinstance(node.slice.value, int)
+                or isinstance(node.slice.value, bool)
+            ):
+                raise RuntimeError(
+                    f'Apenas índices inteiros de "x" (ex.: x[0]) são permitidos na expressão "{expression}".'
+                )
+            if x_len == 0:
+                raise RuntimeError(
+                    f'A variável "x" não pode ser empregada na expressão "{expression}".'
+                )
+            if not 0 <= node.slice.value < x_len:
+                raise RuntimeError(
+                    f'Índice x[{node.slice.value}] fora dos limites (x_len = {x_len}) na expressão "{expression}".'
+                )
+        elif isinstance(node, ast.Name):
+            if any(node is name for name in indexed_names + called_names):
+                continue
+            if node.id in AVAILABLE_FUNCTIONS:
+                raise RuntimeError(
+                    f'A função "{node.id}" deve ser chamada (ex.: {node.id}(x[0])) na expressão "{expression}".'
+                )
+            if node.id not in names:
+                raise RuntimeError(
+                    f'Nome "{node.id}" desconhecido na expressão "{expression}".'
+                )
+        elif isinstance(node, ast.Constant):
+            if not isinstance(node.value, (int, float)) or isinstance(node.value, bool):
+                raise RuntimeError(
+                    f'Apenas constantes numéricas são permitidas na expressão "{expression}".'
+                )
+        elif not isinstance(node, (ast.Load, *AVAILABLE_OPERATORS.keys())):
+            raise RuntimeError(
+                f'Elemento "{type(node).__name__}" não permitido na expressão "{expression}".'
+            )
+
+    return tree
+
+
+def get_literal_value(node):
+    # Valor de um número literal (com ou sem sinal)
+    sign = 1
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.UAdd, ast.USub)):
+        sign = -1 if isinstance(node.op, ast.USub) else 1
+        node = node.operand
+    if (
+        isinstance(node, ast.Constant)
+        and isinstance(node.value, (int, float))
+        and not isinstance(node.value, bool)
+    ):
+        return sign * node.value
+    return None
+
+
+class Problem:
+    def __init__(self, configs):
+        self.variables = configs.get_config_else([], "variables", "problem")
+        self.f_obj_expression = configs.get_config("f_obj", "problem")
+        self.h_const_expressions = self.get_expressions(configs, "h_const")
+        self.g_const_expressions = self.get_expressions(configs, "g_const")
+
+        self.x_len = configs.get_config_else(len(self.variables), "x_len")
+        if len(self.variables) > self.x_len:
+            raise RuntimeError(
+                f"O número de variáveis nomeadas ({len(self.variables)}) é maior do que x_len ({self.x_len})."
+            )
+
+        # Os valores numéricos são representados por escalares NumPy (operações com valores muito grandes
+        # resultam em inf, em vez de empregarem inteiros de precisão arbitrária)
+        self.literals = {}
+
+        # Constantes nomeadas (podem ser definidas a partir das constantes anteriores)
+        self.constants = {
+            name: np.float64(value) for name, value in AVAILABLE_CONSTANTS.items()
+        }
+        for name, value in configs.get_config_else({}, "constants", "problem").items():
+            self.check_name(name)
+            tree = parse_expression(value, self.constants, 0)
+            try:
+                with np.errstate(all="ignore"):
+                    constant = np.float64(eval(self.emit(tree), self.get_namespace()))
+            except Exception as ex:
+                raise RuntimeError(f'Falha na computação da constante "{name}" ({ex}).')
+            if not np.isfinite(constant):
+                raise RuntimeError(
+                    f'O valor da constante "{name}" não é finito ({constant}).'
+                )
+            self.constants[name] = constant
+
+        for name in self.variables:
+            self.check_name(name)
+            if name in self.constants:
+                raise RuntimeError(
+                    f'O nome "{name}" foi empregado tanto como variável quanto como constante.'
+                )
+
+        self.source = self.build_source()
+        namespace = self.get_namespace()
+        exec(compile(self.source, "<lumos.problem>", "exec"), namespace)
+        self.kernel = namespace["kernel"]
+
+    def get_expressions(self, configs, var_name):
+        # Uma única restrição também pode ser informada diretamente (sem a lista)
+        expressions = configs.get_config_else([], var_name, "problem")
+        if isinstance(expressions, str):
+            return [expressions]
+        if not isinstance(expressions, list):
+            raise RuntimeError(
+                f'O parâmetro "{var_name}" do grupo "problem" deve ser uma lista de expressões.'
+            )
+        return expressions
+
+    def check_name(self, name):
+        if (
+            not name.isidentifier()
+            or name.startswith("_")
+            or name == "x"
+            or name in AVAILABLE_FUNCTIONS
+        ):
+            raise RuntimeError(f'Nome "{name}" inválido para variável ou constante.')
+
+    def get_namespace(self):
+        return {
+            "__builtins__": {},
+            **AVAILABLE_FUNCTIONS,
+            **self.constants,
+            **self.literals,
+        }
+
+    def get_literal(self, value):
+        name = f"_c{len(self.literals)}"
+        for literal_name, literal in self.literals.items():
+            if literal == value:
+                return literal_name
+        self.literals[name] = np.float64(value)
+        return name
+
+    def emit(self, node, common=(), temps=None, lines=None):
+        # Código correspondente a um nó da expressão (subexpressões comuns são atribuídas a variáveis temporárias)
+        temps = {} if temps is None else temps
+        key = ast.dump(node)
+        if key in temps:
+            return temps[key]
+
+        if isinstance(node, ast.BinOp):
+            code = (
+                f"({self.emit(node.left, common, temps, lines)} {AVAILABLE_OPERATORS[type(node.op)]} "
+                f"{self.emit(node.right, common, temps, lines)})"
+            )
+        elif isinstance(node, ast.UnaryOp):
+            code = f"({AVAILABLE_OPERATORS[type(node.op)]}{self.emit(node.operand, common, temps, lines)})"
+        elif isinstance(node, ast.Call):
+            code = f"{node.func.id}({', '.join(self.emit(arg, common, temps, lines) for arg in node.args)})"
+        elif isinstance(node, ast.Subscript):
+            code = f"x[{node.slice.value}]"
+        elif isinstance(node, ast.Name):
+            code = node.id
+        else:
+            code = self.get_literal(node.value)
+
+        if key in common:
+            temps[key] = f"_t{len(temps)}"
+            lines.append(f"    {temps[key]} = {code}")
+            return temps[key]
+        return code
+
+    def build_source(self):
+        names = set(self.variables) | set(self.constants)
+        trees = [parse_expression(self.f_obj_expression, names, self.x_len)]
+        trees += [
+            parse_expression(h, names, self.x_len) for h in self.h_const_expressions
+        ]
+        trees += [
+            parse_expression(g, names, self.x_len) for g in self.g_const_expressions
+        ]
+
+        # Subexpressões que se repetem (em uma ou mais expressões) são computadas uma única vez
+        counts = Counter(
+            ast.dump(node)
+            for tree in trees
+            for node in ast.walk(tree)
+            if isinstance(node, (ast.BinOp, ast.UnaryOp, ast.Call))
+        )
+        common = {key for key, count in counts.items() if count > 1}
+
+        lines = [f"    {name} = x[{j}]" for j, name in enumerate(self.variables)]
+        temps = {}
+        outputs = [self.emit(tree, common, temps, lines) for tree in trees]
+        n_h = len(self.h_const_expressions)
+        lines.append(
+            f"    return {outputs[0]}, [{', '.join(outputs[1:1 + n_h])}], "
+            f"[{', '.join(outputs[1 + n_h:])}]"
+        )
+        return "def kernel(x):\n" + "\n".join(lines) + "\n"
+
+    def evaluate(self, x):
+        # x[j] contém o gene j (de um indivíduo ou, no caso de uma matriz, de todos os indivíduos)
+        x = np.asarray(x, dtype=float)
+        f_value, h_values, g_values = self.kernel(x)
+        if x.ndim == 1:
+            return f_value, h_values, g_values
+
+        n = x.shape[1]
+        return (
+            np.broadcast_to(f_value, n).astype(float),
+            np.array([np.broadcast_to(h, n) for h in h_values]).reshape(-1, n),
+            np.array([np.broadcast_to(g, n) for g in g_values]).reshape(-1, n),
+        )
+
+    def f_obj(self, x):
+        return self.evaluate(x)[0]
+
+    def h_const(self, x):
+        return self.evaluate(x)[1]
+
+    def g_const(self, x):
+        return self.evaluate(x)[2]
@@ -1,11 +1,19 @@
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from loguru import logger
 import numpy as np
 import matplotlib.pyplot as plt
 
 from lumos.aux.configs import Configs
+from lumos.aux.expressions import Problem
+from lumos.aux.evaluation_backends import (
+    get_available_evaluation_backends,
+    get_default_workers,
+    autotune,
+    close_executors,
+)
 from lumos.genetic_operators.select_methods import get_available_select_methods
 from lumos.genetic_operators.crossover_methods import get_available_crossover_methods
 from lumos.genetic_operators.mutation_methods import get_available_mutation_methods
@@ -16,6 +24,11 @@ from lumos.genetic_operators.init_population_methods import (
 
 plt.rcParams["font.size"] = 12
 
+# Número estimado de cópias de cada valor (genes, função objetivo e restrições) mantidas durante a avaliação de um
+# lote: fatias e transposições da população, vetores intermediários das expressões e resultados das restrições. O
+# orçamento de memória é, portanto, aproximado
+EVALUATION_TEMPORARIES_FACTOR = 16
+
 
 def is_odd(number):
     if number & 1:
@@ -25,20 +38,57 @@ def is_odd(number):
 
 
 class Ga:
-    def __init__(self, config_file, f_obj, h_const=None, g_const=None):
-        if config_file is None or f_obj is None:
-            print('Os parâmetros "config_file" e "f_obj" não podem ser nulos.')
-            raise RuntimeError(
-                'Os parâmetros "config_file" e "f_obj" não podem ser nulos.'
-            )
+    def __init__(
+        self,
+        config_file,
+        f_obj,
+        h_const=None,
+        g_const=None,
+        config_overrides=None,
+        initial_population=None,
+        callback=None,
+    ):
+        if config_file is None:
+            print('O parâmetro "config_file" não pode ser nulo.')
+            raise RuntimeError('O parâmetro "config_file" não pode ser nulo.')
 
         # Carregamento do arquivo de configurações
-        self.configs = Configs(config_file)
+        self.configs = Configs(config_file, config_overrides)
+
+        # Problema definido por meio de expressões no arquivo de configurações (grupo "problem")
+        self.problem = None
+        if f_obj is None:
+            if not self.configs.config_exists("f_obj", "problem"):
+                print(
+                    'O parâmetro "f_obj" não pode ser nulo caso a função objetivo não seja definida no '
+                    "arquivo de configurações."
+                )
+                raise RuntimeError(
+                    'O parâmetro "f_obj" não pode ser nulo caso a função objetivo não seja definida no '
+                    "arquivo de configurações."
+                )
+            if h_const is not None or g_const is not None:
+                print(
+                    'As restrições "h_const" e "g_const" devem ser definidas no grupo "problem" do arquivo de '
+                    "configurações quando a função objetivo também o é."
+                )
+                raise RuntimeError(
+                    'As restrições "h_const" e "g_const" devem ser definidas no grupo "problem" do arquivo de '
+                    "configurações quando a função objetivo também o é."
+                )
+            self.problem = Problem(self.configs)
+            f_obj = self.problem.f_obj
+            if self.problem.h_const_expressions:
+                h_const = self.problem.h_const
+            if self.problem.g_const_expressions:
+                g_const = self.problem.g_const
 
         # Requisitos de projeto fornecidos pelo usuário (alguns contendo valores padrão)
         self.f_obj = f_obj
         self.h_const = h_const
         self.g_const = g_const
+        self.initial_population = initial_population
+        self.callback = callback
         self.max_gen = None
         self.pop_len = None
         self.x_len = None
@@ -51,6 +101,21 @@ class Ga:
         self.restrictions_weight = None
         self.gene_type = None
         self.bound_constraints_processing = None
+        self.constraint_handling = None
+        self.feasibility_tolerance = None
+        self.lazy_evaluation = None
+        self.max_violation = None
+        self.f_obj_upper_bound = None
+        self.vectorized_constraints = None
+        self.vectorized_f_obj = None
+        self.evaluation_backend = None
+        self.evaluation_workers = None
+        self.evaluation_chunk_size = None
+        self.autotune_interval = None
+        self.autotune_min_parallel_seconds = None
+        self.memory_budget_mb = None
+        self.overlap_chunks = None
+        self.keep_pop_history = None
 
         # Outros atributos
         self.start_time = time.time()
@@ -60,6 +125,12 @@ class Ga:
         self.best_x_history = []
         self.pop_history = []
         self.f_obj_calls = 0
+        self.constraints_len = None
+        self.selected_evaluation_backend = None
+        self.evaluation_cost = None
+        self.evaluation_tuned_gen = 0
+        self.evaluation_executors = {}
+        self.next_pop = None
         self.children_number = None
         self.children = None
         self.num_individuals_to_select = None
@@ -88,16 +159,20 @@ class Ga:
         self.available_crossover_methods = get_available_crossover_methods()
         self.available_mutation_methods = get_available_mutation_methods()
         self.available_init_population_methods = get_available_init_population_methods()
+        self.available_evaluation_backends = get_available_evaluation_backends()
 
         # Definição do logger
-        log_level = self.configs.get_config_else(None, "log_level").upper()
+        log_level = self.configs.get_config_else(None, "log_level")
         if log_level is not None:
+            log_level = log_level.upper()
+            log_path = self.configs.get_config_else("output.log", "log_path")
             logger.remove()
-            logger.add(
-                self.configs.get_config_else("output.log", "log_path"),
-                format="{time} | {level} | {message}",
-                level=log_level,
-            )
+            if log_path:
+                logger.add(
+                    log_path,
+                    format="{time} | {level} | {message}",
+                    level=log_level,
+                )
             logger.add(
                 sys.stdout, format="{time} | {level} | {message}", level=log_level
             )
@@ -111,6 +186,7 @@ class Ga:
 
     def optimize(self):
         try:
+            self.start_time = time.time()
             logger.info(
                 f"Iniciando processo de otimização "
                 f'({datetime.fromtimestamp(time.time()).strftime("%Y-%m-%d %H:%M:%S")}).'
@@ -124,6 +200,8 @@ class Ga:
         except Exception as ex:
             logger.error(f"Ocorreu uma falha durante o processo de otimização ({ex}).")
             raise ex
+        finally:
+            close_executors(self)
 
     def config(self):
         self.check_input_params()
@@ -148,6 +226,58 @@ class Ga:
         self.bound_constraints_processing = self.configs.get_config_else(
             "truncate", "bound_constraints_processing"
         )
+        self.constraint_handling = self.configs.get_config_else(
+            "penalty", "constraint_handling"
+        )
+        self.feasibility_tolerance = self.configs.get_config_else(
+            1e-6, "feasibility_tolerance"
+        )
+        self.lazy_evaluation = self.configs.get_config_else(False, "lazy_evaluation")
+        self.max_violation = self.configs.get_config_else(None, "max_violation")
+        self.f_obj_upper_bound = self.configs.get_config_else(None, "f_obj_upper_bound")
+        self.vectorized_constraints = self.configs.get_config_else(
+            False, "vectorized_constraints"
+        )
+
+        self.vectorized_f_obj = self.configs.get_config_else(False, "vectorized_f_obj")
+        self.evaluation_backend = self.configs.get_config_else(
+            "auto", "evaluation_backend"
+        )
+        self.evaluation_workers = self.configs.get_config_else(
+            get_default_workers(), "evaluation_workers"
+        )
+        self.evaluation_chunk_size = self.configs.get_config_else(
+            None, "evaluation_chunk_size"
+        )
+        self.autotune_interval = self.configs.get_config_else(50, "autotune_interval")
+        self.autotune_min_parallel_seconds = self.configs.get_config_else(
+            0.05, "autotune_min_parallel_seconds"
+        )
+
+        self.memory_budget_mb = self.configs.get_config_else(None, "memory_budget_mb")
+        self.overlap_chunks = self.configs.get_config_else(False, "overlap_chunks")
+        self.keep_pop_history = self.configs.get_config_else(True, "keep_pop_history")
+
+        if (
+            self.evaluation_backend != "auto"
+            and self.evaluation_backend not in self.available_evaluation_backends
+        ):
+            logger.error(
+                f"Método de avaliação informado ({self.evaluation_backend}) não disponível."
+            )
+            raise RuntimeError(
+                f"Método de avaliação informado ({self.evaluation_backend}) não disponível."
+            )
+        if self.evaluation_backend != "auto":
+            self.selected_evaluation_backend = self.evaluation_backend
+
+        if self.constraint_handling not in ("penalty", "feasibility_rules"):
+            logger.error(
+                f"Tratamento de restrições informado ({self.constraint_handling}) inválido."
+            )
+            raise RuntimeError(
+                f"Tratamento de restrições informado ({self.constraint_handling}) inválido."
+            )
 
         # Verificação dos limites superior e inferior para os genes dos indivíduos (limites laterais)
         if len(self.x_l) > self.x_len or len(self.x_u) > self.x_len:
@@ -165,6 +295,11 @@ class Ga:
         logger.info(f"     - Método de seleção: {self.select_method}.")
         logger.info(f"     - Método de recombinação (crossover): {self.cross_method}.")
         logger.info(f"     - Método de mutação: {self.mut_method}.")
+        logger.info(f"     - Tratamento das restrições: {self.constraint_handling}.")
+        logger.info(f"     - Avaliação preguiçosa: {self.lazy_evaluation}.")
+        logger.info(
+            f"     - Método de avaliação da função objetivo: {self.evaluation_backend}."
+        )
 
     def check_param(self, var_name):
         try:
@@ -224,73 +359,261 @@ class Ga:
         self.show_best_x(0)
 
     def get_f_obj_values(self, pop):
-        f_obj_values = np.empty(pop.shape[0])
-        for i in range(pop.shape[0]):
-            # Cálculo da penalidade referente às restrições de igualdade
-            h_f_obj_impact = 0
-            if self.h_const is not None:
-                try:
-                    h_f_obj_impact = np.sum(
-                        [
-                            np.abs(h_value) * self.restrictions_weight
-                            for h_value in self.h_const(pop[i, :])
-                        ]
-                    )
-                except TypeError as ex:
-                    logger.error(
-                        'O método "h_const" deve retornar, obrigatoriamente uma lista.'
-                    )
-                    raise RuntimeError(
-                        f'O método "h_const" deve retornar, obrigatoriamente uma lista ({ex}).'
-                    )
-
-            # Cálculo da penalidade referente às restrições de desigualdade
-            g_f_obj_impact = 0
-            if self.g_const is not None:
-                try:
-                    g_f_obj_impact = np.sum(
-                        [
-                            np.max((g_value * self.restrictions_weight, 0))
-                            for g_value in self.g_const(pop[i, :])
-                        ]
-                    )
-                except TypeError as ex:
-                    logger.error(
-                        'O método "g_const" deve retornar, obrigatoriamente uma lista.'
-                    )
-                    raise RuntimeError(
-                        f'O método "g_const" deve retornar, obrigatoriamente uma lista ({ex}).'
-                    )
-
-            # Cálculo da penalidade referente às restrições laterais
-            l_f_obj_impact = 0
-            if self.bound_constraints_processing != "truncate":
-                l_f_obj_impact += np.sum(
-                    [
-                        np.max(((x_g - self.x_u[j]) * self.restrictions_weight, 0))
-                        for j, x_g in enumerate(pop[i, :])
-                    ]
-                )
-                l_f_obj_impact += np.sum(
-                    [
-                        np.max(((self.x_l[j] - x_g) * self.restrictions_weight, 0))
-                        for j, x_g in enumerate(pop[i, :])
-                    ]
+        # Vetores preenchidos lote a lote (o tamanho dos lotes é limitado pelo orçamento de memória)
+        f_values = np.full(pop.shape[0], np.nan)
+        violations = np.empty(pop.shape[0])
+        evaluate_mask = np.empty(pop.shape[0], dtype=bool)
+        chunks = self.get_chunks(pop)
+
+        # As restrições do lote seguinte podem ser avaliadas enquanto a função objetivo do lote atual é computada.
+        # Há ganho apenas quando uma das etapas libera o GIL (restrições baseadas em operações NumPy sobre lotes
+        # grandes, E/S ou simulações externas, ou função objetivo avaliada pelos métodos "thread" e "process"). No
+        # caso do problema definido no arquivo de configurações, todo o trabalho é feito na preparação do lote
+        if self.overlap_chunks and self.problem is None and len(chunks) > 1:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                self.prepare_chunk(pop, chunks[0], f_values, violations, evaluate_mask)
+                for i, chunk in enumerate(chunks):
+                    next_chunk = chunks[i + 1] if i + 1 < len(chunks) else None
+
+                    # Apenas um lote é preparado antecipadamente. Enquanto o método de avaliação não é escolhido
+                    # (modo "auto"), não há sobreposição, de modo que as medições de custo não são distorcidas
+                    prepared_chunk = None
+                    if (
+                        next_chunk is not None
+                        and self.selected_evaluation_backend is not None
+                    ):
+                        prepared_chunk = executor.submit(
+                            self.prepare_chunk,
+                            pop,
+                            next_chunk,
+                            f_values,
+                            violations,
+                            evaluate_mask,
+                        )
+                    self.evaluate_chunk(pop, chunk, f_values, evaluate_mask)
+                    if prepared_chunk is not None:
+                        prepared_chunk.result()
+                    elif next_chunk is not None:
+                        self.prepare_chunk(
+                            pop, next_chunk, f_values, violations, evaluate_mask
+                        )
+        else:
+            for chunk in chunks:
+                self.prepare_chunk(pop, chunk, f_values, violations, evaluate_mask)
+                self.evaluate_chunk(pop, chunk, f_values, evaluate_mask)
+
+        if not np.all(evaluate_mask):
+            logger.debug(
+                f"Função objetivo não computada para {np.sum(~evaluate_mask)} indivíduos "
+                f"(avaliação preguiçosa)."
+            )
+
+        return self.get_fitness(pop, f_values, violations, evaluate_mask)
+
+    def get_chunks(self, pop):
+        n = pop.shape[0]
+        if self.memory_budget_mb is None:
+            return [slice(0, n)]
+
+        # O número de restrições é medido a partir do primeiro indivíduo (apenas na primeira avaliação)
+        if self.constraints_len is None and (
+            self.h_const is not None or self.g_const is not None
+        ):
+            self.get_const_values(pop[:1])
+
+        # Estimativa da memória empregada por indivíduo durante a avaliação (genes, restrições e temporários)
+        n_values = self.x_len + 1 + (self.constraints_len or 0)
+        chunk_len = max(
+            1,
+            int(
+                self.memory_budget_mb
+                * 2**20
+                // (8 * n_values * EVALUATION_TEMPORARIES_FACTOR)
+            ),
+        )
+        return [
+            slice(start, min(start + chunk_len, n)) for start in range(0, n, chunk_len)
+        ]
+
+    def prepare_chunk(self, pop, chunk, f_values, violations, evaluate_mask):
+        # Problema definido no arquivo de configurações: avaliação vetorizada do lote
+        if self.problem is not None:
+            f_values[chunk], h_values, g_values = self.problem.evaluate(pop[chunk].T)
+            violations[chunk] = self.get_violations(pop[chunk], h_values, g_values)
+            evaluate_mask[chunk] = True
+            return
+
+        # As restrições são avaliadas antes da função objetivo
+        violations[chunk] = self.get_violations(
+            pop[chunk], *self.get_const_values(pop[chunk])
+        )
+        evaluate_mask[chunk] = self.get_evaluate_mask(violations[chunk])
+
+    def evaluate_chunk(self, pop, chunk, f_values, evaluate_mask):
+        if self.problem is not None:
+            self.f_obj_calls += chunk.stop - chunk.start
+            return
+
+        # Computação da função objetivo (apenas para os indivíduos que podem ser selecionados)
+        chunk_mask = evaluate_mask[chunk]
+        if np.any(chunk_mask):
+            chunk_f_values = f_values[chunk]
+            chunk_f_values[chunk_mask] = self.evaluate_f_obj(pop[chunk][chunk_mask])
+
+    def evaluate_f_obj(self, pop):
+        self.f_obj_calls += pop.shape[0]
+
+        # No modo automático, o método de avaliação é escolhido a partir do custo medido na primeira avaliação
+        if self.selected_evaluation_backend is None:
+            return autotune(self, pop)
+
+        start = time.perf_counter()
+        f_values = self.available_evaluation_backends[self.selected_evaluation_backend](
+            self, pop
+        )
+        cost = (time.perf_counter() - start) / pop.shape[0]
+
+        # Verificação periódica da escolha (refeita caso o custo da avaliação tenha se alterado em relação ao
+        # custo medido logo após a escolha)
+        if self.evaluation_cost is None:
+            self.evaluation_cost = cost
+        elif (
+            self.evaluation_backend == "auto"
+            and self.gen - self.evaluation_tuned_gen >= self.autotune_interval
+        ):
+            self.evaluation_tuned_gen = self.gen
+            if not 0.5 <= cost / max(self.evaluation_cost, 1e-12) <= 2:
+                logger.info(
+                    "O custo da avaliação da função objetivo se alterou. O método de avaliação será reavaliado."
                 )
+                self.selected_evaluation_backend = None
+
+        return f_values
+
+    def get_violations(self, pop, h_values, g_values):
+        violations = np.zeros(pop.shape[0])
+
+        # Violação das restrições de igualdade
+        if h_values is not None:
+            violations += np.sum(np.abs(h_values), axis=0)
+
+        # Violação das restrições de desigualdade
+        if g_values is not None:
+            violations += np.sum(np.maximum(g_values, 0), axis=0)
+
+        # Violação das restrições laterais
+        if self.bound_constraints_processing != "truncate":
+            violations += np.sum(np.maximum(pop - self.x_u, 0), axis=1)
+            violations += np.sum(np.maximum(self.x_l - pop, 0), axis=1)
+
+        return violations
+
+    def get_const_values(self, pop):
+        h_values = None
+        if self.h_const is not None:
+            h_values = self.eval_const(self.h_const, "h_const", pop)
+
+        g_values = None
+        if self.g_const is not None:
+            g_values = self.eval_const(self.g_const, "g_const", pop)
+
+        self.constraints_len = sum(
+            values.shape[0] for values in (h_values, g_values) if values is not None
+        )
+        return h_values, g_values
 
-            # Computação da função objetivo
-            f_obj_values[i] = (
-                self.f_obj(pop[i, :]) - h_f_obj_impact - g_f_obj_impact - l_f_obj_impact
+    def eval_const(self, const, const_name, pop):
+        # Retorna uma matriz com dimensões (número de restrições, tamanho da população)
+        try:
+            if self.vectorized_constraints:
+                # A restrição recebe a população transposta (x[j] contém o gene j de todos os indivíduos)
+                return np.array(
+                    [np.broadcast_to(value, pop.shape[0]) for value in const(pop.T)],
+                    dtype=float,
+                ).reshape(-1, pop.shape[0])
+
+            return (
+                np.array([list(const(x)) for x in pop], dtype=float)
+                .reshape(pop.shape[0], -1)
+                .T
+            )
+        except TypeError as ex:
+            logger.error(
+                f'O método "{const_name}" deve retornar, obrigatoriamente uma lista.'
+            )
+            raise RuntimeError(
+                f'O método "{const_name}" deve retornar, obrigatoriamente uma lista ({ex}).'
             )
 
-            if np.isnan(f_obj_values[i]):
-                logger.error(
-                    f"Foi produzido um NaN durante a computação da função objetivo. Indivíduo: {pop[i, :]}"
+    def get_evaluate_mask(self, violations):
+        evaluate_mask = np.ones(violations.shape[0], dtype=bool)
+        if not self.lazy_evaluation:
+            return evaluate_mask
+
+        # Pelas regras de viabilidade, a função objetivo de indivíduos inviáveis é irrelevante
+        if self.constraint_handling == "feasibility_rules":
+            return violations <= self.feasibility_tolerance
+
+        if self.max_violation is not None:
+            evaluate_mask &= violations <= self.max_violation
+
+        # Indivíduos que, mesmo no melhor caso, ficariam abaixo do pior fitness da população atual (apenas
+        # quando o limite superior da função objetivo é informado pelo usuário)
+        if self.f_obj_values is not None and self.f_obj_upper_bound is not None:
+            finite_f_obj_values = self.f_obj_values[np.isfinite(self.f_obj_values)]
+            if finite_f_obj_values.size > 0:
+                evaluate_mask &= (
+                    self.f_obj_upper_bound - self.restrictions_weight * violations
+                    >= np.min(finite_f_obj_values)
                 )
-                logger.error("Atribuindo ao indivíduo em questão fitness igual a -inf.")
-                f_obj_values[i] = -np.inf
 
-            self.f_obj_calls += 1
+        return evaluate_mask
+
+    def get_fitness(self, pop, f_values, violations, evaluate_mask):
+        fitness = self.get_constrained_fitness(f_values, violations, evaluate_mask)
+
+        # NaNs produzidos pela função objetivo ou pelas restrições
+        for i in np.nonzero(np.isnan(fitness))[0]:
+            logger.error(
+                f"Foi produzido um NaN durante a computação do fitness. Indivíduo: {pop[i, :]}"
+            )
+            logger.error("Atribuindo ao indivíduo em questão fitness igual a -inf.")
+            fitness[i] = -np.inf
+
+        return fitness
+
+    def get_constrained_fitness(self, f_values, violations, evaluate_mask):
+        # Regras de viabilidade (Deb): indivíduos viáveis são comparados pela função objetivo, enquanto os
+        # inviáveis ficam abaixo do pior indivíduo viável e são comparados pela violação das restrições
+        if self.constraint_handling == "feasibility_rules":
+            feasible = violations <= self.feasibility_tolerance
+            f_feasible = f_values[feasible & np.isfinite(f_values)]
+            worst_feasible = np.min(f_feasible) if f_feasible.size > 0 else 0.0
+            return np.where(feasible, f_values, worst_feasible - violations)
+
+        f_obj_values = f_values - self.restrictions_weight * violations
+
+        # Fitness limitado atribuído aos indivíduos cuja função objetivo não foi computada (abaixo do pior
+        # fitness conhecido, ordenado de acordo com a violação das restrições)
+        skipped = ~evaluate_mask
+        if np.any(skipped):
+            reference = f_obj_values[evaluate_mask & np.isfinite(f_obj_values)]
+            if self.f_obj_values is not None:
+                reference = np.concatenate(
+                    (reference, self.f_obj_values[np.isfinite(self.f_obj_values)])
+                )
+            if reference.size > 0:
+                worst, best = np.min(reference), np.max(reference)
+                spread = best - worst if best > worst else max(np.abs(worst), 1.0)
+                skipped_violations = violations[skipped & np.isfinite(violations)]
+                max_violation = (
+                    np.max(skipped_violations) if skipped_violations.size > 0 else 0.0
+                )
+                f_obj_values[skipped] = worst - spread * violations[skipped] / (
+                    max_violation if max_violation > 0 else 1.0
+                )
+            else:
+                f_obj_values[skipped] = -self.restrictions_weight * violations[skipped]
 
         return f_obj_values
 
@@ -361,12 +684,22 @@ class Ga:
 
     def build_new_pop(self, mutate_children):
         logger.debug("Iniciando construção da nova população.")
-        f_obj_values_sort_index = np.argsort(-self.f_obj_values)[
-            : self.num_individuals_to_mantain
-        ]
-        individuals_to_mantain = self.pop[f_obj_values_sort_index, :]
 
-        self.pop = np.concatenate((individuals_to_mantain, mutate_children))
+        # Seleção dos melhores indivíduos (elitismo) sem a ordenação de toda a população
+        k = self.num_individuals_to_mantain
+        elite_index = np.empty(0, dtype=np.int64)
+        if k > 0:
+            elite_index = np.argpartition(-self.f_obj_values, k - 1)[:k]
+            elite_index = elite_index[
+                np.argsort(-self.f_obj_values[elite_index], kind="stable")
+            ]
+
+        # Quando o histórico das populações não é mantido, a memória da população anterior é reaproveitada
+        if self.keep_pop_history or self.next_pop is None:
+            self.next_pop = np.empty((k + mutate_children.shape[0], self.x_len))
+        self.next_pop[:k] = self.pop[elite_index, :]
+        self.next_pop[k:] = mutate_children
+        self.pop, self.next_pop = self.next_pop, self.pop
         self.bound_constraint_processing()
         self.f_obj_values = self.get_f_obj_values(self.pop)
 
@@ -377,17 +710,16 @@ class Ga:
             logger.debug(
                 "Realizando o truncameno dos genes dos indivíduos da população."
             )
-            for i in range(self.pop.shape[0]):
-                for j in range(self.pop.shape[1]):
-                    self.pop[i, j] = np.min((self.pop[i, j], self.x_u[j]))
-                    self.pop[i, j] = np.max((self.pop[i, j], self.x_l[j]))
+            np.minimum(self.pop, self.x_u, out=self.pop)
+            np.maximum(self.pop, self.x_l, out=self.pop)
 
     def show_best_x(self, gen):
         best_fitness = np.max(self.f_obj_values)
-        best_x = self.pop[np.argmax(self.f_obj_values), :]
+        best_x = self.pop[np.argmax(self.f_obj_values), :].copy()
         self.f_obj_history.append(best_fitness)
         self.best_x_history.append(best_x)
-        self.pop_history.append(self.pop)
+        if self.keep_pop_history:
+            self.pop_history.append(self.pop)
         logger.info(
             f"Geração: {gen} | Melhor fitness: {best_fitness} | Indivíduo: {best_x}"
         )
@@ -404,6 +736,11 @@ class Ga:
         )
         logger.debug("Iniciando verificação dos critérios de parada.")
 
+        # A função de callback recebe o Ga a cada geração e pode solicitar o encerramento da otimização
+        if self.callback is not None and self.callback(self):
+            logger.info("Otimização interrompida pela função de callback.")
+            return True
+
         if (
             max_exec_time_seconds is not None
             and time.time() - self.start_time > max_exec_time_seconds
@@ -462,19 +799,32 @@ class Ga:
         logger.info(f"Número de gerações: {self.gen}.")
         logger.info(f"Número de avaliações da função objetivo: {self.f_obj_calls}.")
 
-        plt.figure()
-        plt.plot(self.f_obj_history, linewidth=1.5)
-        plt.plot(self.f_obj_history, ".", markersize=5, color="tab:blue")
-        plt.title("Evolução do fitness ao longo das gerações")
-        plt.xlabel("Geração")
-        plt.ylabel("Fitness")
-        plt.grid(linestyle="--")
-        plt.tight_layout()
-        plt.savefig("fitness_history.eps")
+        # Armazenamento da população final (ordenada pelo fitness), que pode ser empregada como warm start
+        final_pop_path = self.configs.get_config_else(None, "final_pop_path")
+        if final_pop_path:
+            np.save(final_pop_path, self.pop[np.argsort(-self.f_obj_values), :])
+            logger.info(f"População final armazenada em {final_pop_path}.")
 
         # Representação gráfica dos resultados
-        if self.configs.get_config_else(None, "plot_f_obj_history"):
-            plt.show()
+        f_obj_history_path = self.configs.get_config_else(
+            "fitness_history.eps", "f_obj_history_path"
+        )
+        plot_f_obj_history = self.configs.get_config_else(None, "plot_f_obj_history")
+        if f_obj_history_path or plot_f_obj_history:
+            plt.figure()
+            plt.plot(self.f_obj_history, linewidth=1.5)
+            plt.plot(self.f_obj_history, ".", markersize=5, color="tab:blue")
+            plt.title("Evolução do fitness ao longo das gerações")
+            plt.xlabel("Geração")
+            plt.ylabel("Fitness")
+            plt.grid(linestyle="--")
+            plt.tight_layout()
+            if f_obj_history_path:
+                plt.savefig(f_obj_history_path)
+            if plot_f_obj_history:
+                plt.show()
+            else:
+                plt.close()
 
         return results
 
@@ -9,16 +9,11 @@ def get_available_crossover_methods():
 def arithmetic_recombination(ga_data, select_individuals):
     logger.debug("Iniciando etapa de recombinação (método da recombinação aritmética).")
     alpha = ga_data.configs.get_config("alpha", "crossover")
+    parents_1 = select_individuals[0 : ga_data.children_number : 2, :]
+    parents_2 = select_individuals[1 : ga_data.children_number : 2, :]
     children = np.empty((ga_data.children_number, ga_data.x_len))
-    for i in range(0, ga_data.children_number, 2):
-        for j in range(ga_data.x_len):
-            children[i, j] = (
-                alpha * select_individuals[i, j]
-                + (1 - alpha) * select_individuals[i + 1, j]
-            )
-            children[i + 1, j] = (1 - alpha) * select_individuals[
-                i, j
-            ] + alpha * select_individuals[i + 1, j]
+    children[0::2, :] = alpha * parents_1 + (1 - alpha) * parents_2
+    children[1::2, :] = (1 - alpha) * parents_1 + alpha * parents_2
 
     logger.debug("Recombinação concluída com sucesso.")
     return children
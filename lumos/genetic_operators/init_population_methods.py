@@ -3,22 +3,126 @@ import numpy as np
 
 
 def get_available_init_population_methods():
-    return {"real": real}
+    return {"real": real, "latin_hypercube": latin_hypercube, "halton": halton}
 
 
 def real(ga_data):
     logger.debug(
         "Definição dos indivíduos da população inicial (em que os genes são números reais)."
     )
-    pop = np.empty((ga_data.pop_len, ga_data.x_len))
-    for i in range(ga_data.pop_len):
-        for j in range(ga_data.x_len):
-            pop[i, j] = ga_data.x_l[j] + ga_data.rnd.random() * (
-                ga_data.x_u[j] - ga_data.x_l[j]
-            )
+    return build_population(ga_data, lambda n: ga_data.rnd.random((n, ga_data.x_len)))
+
+
+def latin_hypercube(ga_data):
+    logger.debug(
+        "Definição dos indivíduos da população inicial (amostragem por hipercubo latino)."
+    )
+
+    def sample(n):
+        # Cada gene é dividido em n estratos, sendo cada estrato ocupado por um único indivíduo
+        strata = ga_data.rnd.permuted(
+            np.tile(np.arange(n), (ga_data.x_len, 1)), axis=1
+        ).T
+        return (strata + ga_data.rnd.random((n, ga_data.x_len))) / n
+
+    return build_population(ga_data, sample)
+
+
+def halton(ga_data):
+    logger.debug("Definição dos indivíduos da população inicial (sequência de Halton).")
+
+    def sample(n):
+        # Sequência de Halton com deslocamento aleatório (rotação de Cranley-Patterson)
+        bases = get_primes(ga_data.x_len)
+        points = np.empty((n, ga_data.x_len))
+        for j, base in enumerate(bases):
+            points[:, j] = radical_inverse(np.arange(1, n + 1), base)
+        return np.mod(points + ga_data.rnd.random(ga_data.x_len), 1.0)
+
+    return build_population(ga_data, sample)
+
+
+def build_population(ga_data, sample):
+    # Indivíduos conhecidos (warm start) completados por indivíduos amostrados no hipercubo unitário
+    warm_pop = get_warm_start_population(ga_data)
+    unit_pop = sample(ga_data.pop_len - warm_pop.shape[0])
+    x_l = np.asarray(ga_data.x_l, dtype=float)
+    x_u = np.asarray(ga_data.x_u, dtype=float)
+    pop = np.concatenate((warm_pop, x_l + unit_pop * (x_u - x_l)))
 
     logger.debug(
         "Inicialização do vetor que armazena os fitness dos indivíduos da população."
     )
     f_obj_values = ga_data.get_f_obj_values(pop)
     return pop, f_obj_values
+
+
+def get_warm_start_population(ga_data):
+    warm_pop = ga_data.initial_population
+    warm_start_file = ga_data.configs.get_config_else(None, "warm_start_file")
+    if warm_pop is None and warm_start_file is not None:
+        warm_pop = load_population(warm_start_file)
+
+    if warm_pop is None:
+        return np.empty((0, ga_data.x_len))
+
+    warm_pop = np.atleast_2d(np.asarray(warm_pop, dtype=float))
+    if warm_pop.shape[1] != ga_data.x_len:
+        logger.error(
+            f"Os indivíduos da população inicial informada devem possuir {ga_data.x_len} genes."
+        )
+        raise RuntimeError(
+            f"Os indivíduos da população inicial informada devem possuir {ga_data.x_len} genes."
+        )
+
+    warm_pop = warm_pop[: ga_data.pop_len]
+    if ga_data.bound_constraints_processing == "truncate":
+        warm_pop = np.clip(warm_pop, ga_data.x_l, ga_data.x_u)
+
+    logger.info(
+        f"{warm_pop.shape[0]} indivíduos da população inicial foram fornecidos pelo usuário (warm start)."
+    )
+    return warm_pop
+
+
+def load_population(file_name):
+    try:
+        if file_name.endswith(".npy"):
+            return np.load(file_name)
+        if file_name.endswith(".npz"):
+            # Arquivos com mais de um vetor devem armazenar a população sob a chave "pop"
+            with np.load(file_name) as pop_file:
+                if "pop" in pop_file.files:
+                    return pop_file["pop"]
+                if len(pop_file.files) == 1:
+                    return pop_file[pop_file.files[0]]
+                raise RuntimeError(
+                    f'O arquivo {file_name} contém mais de um vetor e nenhum deles possui a chave "pop".'
+                )
+        return np.loadtxt(
+            file_name, delimiter="," if file_name.endswith(".csv") else None, ndmin=2
+        )
+    except Exception as ex:
+        logger.error(f"Falha no carregamento da população inicial ({ex}).")
+        raise RuntimeError(f"Falha no carregamento da população inicial ({ex}).")
+
+
+def get_primes(n):
+    primes = []
+    candidate = 2
+    while len(primes) < n:
+        if all(candidate % prime for prime in primes):
+            primes.append(candidate)
+        candidate += 1
+    return primes
+
+
+def radical_inverse(indexes, base):
+    result = np.zeros(indexes.shape[0])
+    factor = 1.0 / base
+    indexes = indexes.copy()
+    while np.any(indexes > 0):
+        result += factor * (indexes % base)
+        indexes //= base
+        factor /= base
+    return result
@@ -24,23 +24,15 @@ def roulette(ga_data):
     f_obj_values = f_obj_values / f_obj_sum
 
     # Construção da roleta
-    roulette_limits = np.empty(ga_data.pop_len)
-
-    for i, f_obj in enumerate(f_obj_values):
-        if i == 0:
-            roulette_limits[i] = f_obj_values[i]
-        else:
-            roulette_limits[i] = roulette_limits[i - 1] + f_obj_values[i]
+    roulette_limits = np.cumsum(f_obj_values)
 
     # Sorteio dos indivíduos pais para a etapa de crossover
-    select_individuals = np.empty((ga_data.num_individuals_to_select, ga_data.x_len))
-    for i in range(ga_data.num_individuals_to_select):
-        random_number = ga_data.rnd.random()
-        try:
-            select_index = np.nonzero(roulette_limits > random_number)[0][0]
-        except:
-            print("ERROR")
-        select_individuals[i, :] = ga_data.pop[select_index, :]
+    random_numbers = ga_data.rnd.random(ga_data.num_individuals_to_select)
+    select_index = np.minimum(
+        np.searchsorted(roulette_limits, random_numbers, side="right"),
+        roulette_limits.shape[0] - 1,
+    )
+    select_individuals = ga_data.pop[select_index, :]
 
     logger.debug("Seleção concluída com sucesso.")
     return select_individuals
@@ -0,0 +1,407 @@
+import argparse
+import importlib
+import io
+import ipaddress
+import json
+import multiprocessing
+import socket
+import socketserver
+import sys
+import threading
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from loguru import logger
+import numpy as np
+
+from lumos.ga import Ga
+
+
+# Protocolo (uma mensagem JSON por linha):
+#   {"cmd": "submit", "job_id": "...", "config": {...} ou "config_file": "...", "f_obj": "modulo:funcao",
+#    "h_const": "modulo:funcao", "g_const": "modulo:funcao", "config_overrides": {...}}
+#   {"cmd": "cancel", "job_id": "..."}
+#   {"cmd": "status"}
+#   {"cmd": "shutdown"}
+# Eventos enviados ao cliente: "accepted", "progress", "done", "cancelled", "error" e "status".
+
+# Parâmetros impostos a cada job (o logger global e o diretório corrente são compartilhados pelos jobs)
+JOB_OVERRIDES = {
+    "log_level": None,
+    "plot_f_obj_history": False,
+    "f_obj_history_path": False,
+    "keep_pop_history": False,
+    "final_pop_path": False,
+    "evaluation_workers": 1,
+}
+
+# Funções já importadas pelo processo (reaproveitadas pelos jobs seguintes)
+loaded_functions = {}
+
+
+def init_worker(log_level):
+    logger.remove()
+    logger.configure(extra={"job_id": "-"})
+    if log_level is not None:
+        logger.add(
+            sys.stderr,
+            format="{time} | {level} | {extra[job_id]} | {message}",
+            level=log_level.upper(),
+        )
+
+
+def load_function(reference):
+    if reference is None:
+        return None
+
+    if reference not in loaded_functions:
+        try:
+            module_name, function_name = reference.split(":")
+            loaded_functions[reference] = getattr(
+                importlib.import_module(module_name), function_name
+            )
+        except Exception as ex:
+            raise RuntimeError(f'Falha no carregamento da função "{reference}" ({ex}).')
+
+    return loaded_functions[reference]
+
+
+def to_json(value):
+    if isinstance(value, dict):
+        return {key: to_json(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return [to_json(item) for item in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def run_job(job_id, job, events, cancel_flags, progress_interval):
+    def callback(ga):
+        if ga.gen % progress_interval == 0:
+            events.put(
+                {
+                    "event": "progress",
+                    "job_id": job_id,
+                    "gen": ga.gen,
+                    "best_f": float(ga.f_obj_history[-1]),
+                    "best_x": to_json(ga.best_x_history[-1]),
+                }
+            )
+        return cancel_flags.get(job_id, False)
+
+    with logger.contextualize(job_id=job_id):
+        ga = Ga(
+            job.get("config_file", job.get("config")),
+            load_function(job.get("f_obj")),
+            h_const=load_function(job.get("h_const")),
+            g_const=load_function(job.get("g_const")),
+            config_overrides={**job.get("config_overrides", {}), **JOB_OVERRIDES},
+            callback=callback,
+        )
+        results = ga.optimize()
+
+    return to_json(results), cancel_flags.get(job_id, False)
+
+
+class OptimizationService:
+    def __init__(
+        self, max_workers=None, max_jobs=100, progress_interval=1, log_level="INFO"
+    ):
+        self.max_workers = max_workers
+        self.max_jobs = max_jobs
+        self.progress_interval = progress_interval
+        self.log_level = log_level
+        self.jobs = {}
+        self.lock = threading.RLock()
+
+        # Pool de processos compartilhado pelos jobs (os processos são mantidos entre os jobs)
+        self.manager = multiprocessing.Manager()
+        self.events = self.manager.Queue()
+        self.cancel_flags = self.manager.dict()
+        self.executor = self.build_executor()
+
+        self.events_thread = threading.Thread(target=self.forward_events, daemon=True)
+        self.events_thread.start()
+        logger.info("Serviço de otimização iniciado.")
+
+    def build_executor(self):
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=init_worker,
+            initargs=(self.log_level,),
+        )
+
+    def handle(self, request, send):
+        # Falhas no processamento de uma mensagem não devem encerrar o serviço
+        try:
+            cmd = request.get("cmd")
+            if cmd == "submit":
+                self.submit(request, send)
+            elif cmd == "cancel":
+                self.cancel(request.get("job_id"), send)
+            elif cmd == "status":
+                with self.lock:
+                    jobs = {
+                        job_id: "running" if job["future"].running() else "pending"
+                        for job_id, job in self.jobs.items()
+                        if not job["future"].done()
+                    }
+                send({"event": "status", "jobs": jobs})
+            else:
+                send({"event": "error", "message": f'Comando "{cmd}" desconhecido.'})
+        except Exception as ex:
+            logger.error(f"Falha no processamento da mensagem ({ex}).")
+            send(
+                {
+                    "event": "error",
+                    "message": f"Falha no processamento da mensagem ({ex}).",
+                }
+            )
+
+    def submit(self, request, send):
+        with self.lock:
+            job_id = str(request.get("job_id") or uuid.uuid4().hex)
+            if job_id in self.jobs:
+                send(
+                    {
+                        "event": "error",
+                        "job_id": job_id,
+                        "message": f"Já existe um job com o identificador {job_id}.",
+                    }
+                )
+                return
+            if len(self.jobs) >= self.max_jobs:
+                send(
+                    {
+                        "event": "error",
+                        "job_id": job_id,
+                        "message": f"Limite de jobs simultâneos ({self.max_jobs}) alcançado.",
+                    }
+                )
+                return
+
+            self.cancel_flags[job_id] = False
+            try:
+                future = self.submit_job(job_id, request)
+            except Exception as ex:
+                self.cancel_flags.pop(job_id, None)
+                logger.error(f"Falha no envio do job {job_id} ao pool ({ex}).")
+                send(
+                    {
+                        "event": "error",
+                        "job_id": job_id,
+                        "message": f"Falha no envio do job ao pool ({ex}).",
+                    }
+                )
+                return
+            self.jobs[job_id] = {"future": future, "send": send}
+            send({"event": "accepted", "job_id": job_id})
+
+        logger.info(f"Job {job_id} recebido.")
+        future.add_done_callback(lambda f: self.finish_job(job_id, f))
+
+    def submit_job(self, job_id, request):
+        args = (job_id, request, self.events, self.cancel_flags, self.progress_interval)
+        try:
+            return self.executor.submit(run_job, *args)
+        except BrokenProcessPool:
+            # Um processo do pool foi encerrado abruptamente (os jobs em execução já foram finalizados com erro)
+            logger.error("Pool de processos corrompido. Um novo pool será criado.")
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = self.build_executor()
+            return self.executor.submit(run_job, *args)
+
+    def cancel(self, job_id, send):
+        with self.lock:
+            job = self.jobs.get(job_id)
+            if job is None or job["future"].done():
+                send(
+                    {
+                        "event": "error",
+                        "job_id": job_id,
+                        "message": f"Job {job_id} não encontrado.",
+                    }
+                )
+                return
+
+            # Jobs ainda não iniciados são removidos da fila, enquanto os demais são encerrados na geração seguinte
+            self.cancel_flags[job_id] = True
+            job["future"].cancel()
+
+        logger.info(f"Cancelamento do job {job_id} solicitado.")
+
+    def finish_job(self, job_id, future):
+        self.cancel_flags.pop(job_id, None)
+
+        # O evento final segue pela mesma fila dos eventos de progresso (que, assim, são enviados antes dele)
+        if future.cancelled():
+            event = {"event": "cancelled", "job_id": job_id, "results": None}
+        elif future.exception() is not None:
+            logger.error(f"Falha na execução do job {job_id} ({future.exception()}).")
+            event = {
+                "event": "error",
+                "job_id": job_id,
+                "message": str(future.exception()),
+            }
+        else:
+            results, cancelled = future.result()
+            event = {
+                "event": "cancelled" if cancelled else "done",
+                "job_id": job_id,
+                "results": results,
+            }
+        self.events.put(event)
+        logger.info(f"Job {job_id} encerrado.")
+
+    def forward_events(self):
+        while True:
+            event = self.events.get()
+            if event is None:
+                break
+
+            # O job é removido apenas após o envio de seu evento final
+            with self.lock:
+                if event["event"] == "progress":
+                    job = self.jobs.get(event["job_id"])
+                else:
+                    job = self.jobs.pop(event["job_id"], None)
+            if job is not None:
+                job["send"](event)
+
+    def shutdown(self, cancel_jobs=True):
+        # Sem o cancelamento, o encerramento aguarda a conclusão de todos os jobs recebidos
+        if cancel_jobs:
+            with self.lock:
+                for job_id in self.jobs.keys():
+                    self.cancel_flags[job_id] = True
+        else:
+            logger.info("Aguardando a conclusão dos jobs em andamento.")
+        self.executor.shutdown(wait=True, cancel_futures=cancel_jobs)
+        self.events.put(None)
+        self.events_thread.join()
+        self.manager.shutdown()
+        logger.info("Serviço de otimização encerrado.")
+
+
+def build_sender(stream):
+    lock = threading.Lock()
+
+    def send(message):
+        with lock:
+            try:
+                stream.write(json.dumps(message) + "\n")
+                stream.flush()
+            except (BrokenPipeError, ValueError, OSError):
+                logger.error("Falha no envio de mensagem ao cliente.")
+
+    return send
+
+
+def handle_line(service, line, send):
+    try:
+        request = json.loads(line)
+    except json.JSONDecodeError as ex:
+        send({"event": "error", "message": f"Mensagem inválida ({ex})."})
+        return True
+
+    if not isinstance(request, dict):
+        send({"event": "error", "message": "Mensagem inválida (objeto JSON esperado)."})
+        return True
+
+    if request.get("cmd") == "shutdown":
+        return False
+    service.handle(request, send)
+    return True
+
+
+def serve_stdio(service):
+    # O fim da entrada padrão encerra o serviço após a conclusão dos jobs (apenas o comando "shutdown" os cancela)
+    send = build_sender(sys.stdout)
+    for line in sys.stdin:
+        if line.strip() and not handle_line(service, line, send):
+            service.shutdown(cancel_jobs=True)
+            return
+    service.shutdown(cancel_jobs=False)
+
+
+def is_loopback_host(host):
+    try:
+        addresses = {info[4][0] for info in socket.getaddrinfo(host, None)}
+    except OSError:
+        return False
+    return all(
+        ipaddress.ip_address(address.split("%")[0]).is_loopback for address in addresses
+    )
+
+
+def check_host(host):
+    # Os jobs importam e executam funções indicadas pelos clientes (não há autenticação), de modo que apenas
+    # conexões locais são aceitas
+    if not is_loopback_host(host):
+        logger.error(
+            f"O serviço aceita apenas endereços locais (loopback). Endereço informado: {host}."
+        )
+        raise RuntimeError(
+            f"O serviço aceita apenas endereços locais (loopback). Endereço informado: {host}."
+        )
+
+
+def serve_socket(service, host, port):
+    try:
+        check_host(host)
+    except RuntimeError:
+        service.shutdown()
+        raise
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            send = build_sender(
+                io.TextIOWrapper(self.wfile, encoding="utf-8", write_through=True)
+            )
+            for line in self.rfile:
+                line = line.decode("utf-8")
+                if line.strip() and not handle_line(service, line, send):
+                    threading.Thread(target=server.shutdown).start()
+                    break
+
+    class Server(socketserver.ThreadingTCPServer):
+        daemon_threads = True
+        allow_reuse_address = True
+
+    with Server((host, port), Handler) as server:
+        logger.info(f"Aguardando conexões em {host}:{port}.")
+        server.serve_forever()
+    service.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serviço de otimização do Lumos.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--max-jobs", type=int, default=100)
+    parser.add_argument("--progress-interval", type=int, default=1)
+    parser.add_argument("--log-level", default="INFO")
+    args = parser.parse_args()
+
+    # Os logs são direcionados para stderr (no modo stdio, stdout é reservado ao protocolo)
+    logger.remove()
+    logger.add(sys.stderr, level=args.log_level.upper())
+    if args.port is not None:
+        check_host(args.host)
+
+    service = OptimizationService(
+        max_workers=args.workers,
+        max_jobs=args.max_jobs,
+        progress_interval=args.progress_interval,
+        log_level=args.log_level,
+    )
+    if args.port is None:
+        serve_stdio(service)
+    else:
+        serve_socket(service, args.host, args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+import csv
+import itertools
+import time
+from concurrent.futures import ProcessPoolExecutor
+from loguru import logger
+import numpy as np
+
+from lumos.aux.configs import Configs
+from lumos.ga import Ga
+
+
+# Parâmetros impostos a cada execução da varredura (evitam o custo dos logs e da construção dos gráficos)
+RUN_OVERRIDES = {
+    "log_level": "ERROR",
+    "log_path": False,
+    "plot_f_obj_history": False,
+    "f_obj_history_path": False,
+    "keep_pop_history": False,
+    "final_pop_path": False,
+    "evaluation_workers": 1,
+}
+
+# Parâmetros definidos pela própria varredura (não podem ser variados)
+RESERVED_PARAMS = {
+    "max_gen",
+    "random_seed",
+    "run_id",
+    "rung",
+    "gen_budget",
+    "best_f",
+    "best_x",
+    "gen",
+    "f_calls",
+    "exec_time",
+    "error",
+}
+
+
+def build_grid(param_grid):
+    names = list(param_grid.keys())
+    return [
+        dict(zip(names, values))
+        for values in itertools.product(*[param_grid[name] for name in names])
+    ]
+
+
+def build_random_samples(param_ranges, n_samples, rnd):
+    samples = []
+    for _ in range(n_samples):
+        sample = {}
+        for name, (low, high) in param_ranges.items():
+            if isinstance(low, int) and isinstance(high, int):
+                sample[name] = int(rnd.integers(low, high + 1))
+            else:
+                sample[name] = float(low + rnd.random() * (high - low))
+        samples.append(sample)
+    return samples
+
+
+def run_config(args):
+    config_file, f_obj, h_const, g_const, overrides = args
+    try:
+        results = Ga(
+            config_file,
+            f_obj,
+            h_const=h_const,
+            g_const=g_const,
+            config_overrides=overrides,
+        ).optimize()
+        return {
+            "best_f": float(results["best_f"]),
+            "best_x": [float(x) for x in results["best_x"]],
+            "gen": results["max_gen"],
+            "f_calls": results["f_calls"],
+            "exec_time": results["exec_time"],
+            "error": None,
+        }
+    except Exception as ex:
+        return {
+            "best_f": -np.inf,
+            "best_x": None,
+            "gen": 0,
+            "f_calls": 0,
+            "exec_time": 0.0,
+            "error": str(ex),
+        }
+
+
+class Sweep:
+    def __init__(
+        self,
+        config_file,
+        f_obj,
+        h_const=None,
+        g_const=None,
+        param_grid=None,
+        param_ranges=None,
+        n_samples=None,
+        max_workers=None,
+        random_seed=None,
+        halving_min_gen=None,
+        halving_eta=3,
+    ):
+        if param_grid is None and param_ranges is None:
+            raise RuntimeError(
+                'Ao menos um dos parâmetros "param_grid" e "param_ranges" deve ser informado.'
+            )
+        if param_ranges is not None and n_samples is None:
+            raise RuntimeError(
+                'O parâmetro "n_samples" deve ser informado juntamente com "param_ranges".'
+            )
+        if halving_eta < 2:
+            raise RuntimeError('O parâmetro "halving_eta" deve ser maior ou igual a 2.')
+
+        # As funções devem ser definidas no nível do módulo (precisam ser serializadas pelo pool de processos)
+        self.config_file = config_file
+        self.f_obj = f_obj
+        self.h_const = h_const
+        self.g_const = g_const
+        self.max_workers = max_workers
+        self.halving_min_gen = halving_min_gen
+        self.halving_eta = halving_eta
+        self.configs = Configs(config_file)
+        self.max_gen = self.configs.get_config("max_gen")
+
+        random_seed = random_seed if random_seed is not None else int(time.time())
+        logger.info(f"Semente utilizada na varredura de parâmetros: {random_seed}.")
+        self.rnd = np.random.default_rng(random_seed)
+
+        # Construção das configurações a serem avaliadas (cada uma com sua própria semente)
+        self.param_sets = []
+        if param_grid is not None:
+            self.param_sets += build_grid(param_grid)
+        if param_ranges is not None:
+            self.param_sets += build_random_samples(param_ranges, n_samples, self.rnd)
+
+        reserved_params = sorted(
+            {name for params in self.param_sets for name in params} & RESERVED_PARAMS
+        )
+        if reserved_params:
+            raise RuntimeError(
+                f"Os parâmetros {reserved_params} são definidos pela varredura e não podem ser variados."
+            )
+
+        # Parâmetros inexistentes no arquivo base (ex.: nomes digitados incorretamente) não teriam efeito
+        unknown_params = sorted(
+            name
+            for name in {name for params in self.param_sets for name in params}
+            if not self.configs.config_exists(*reversed(name.split(".", 1)))
+        )
+        if unknown_params:
+            raise RuntimeError(
+                f"Os parâmetros {unknown_params} não foram encontrados no arquivo de configurações base."
+            )
+        self.seeds = [int(self.rnd.integers(0, 2**31 - 1)) for _ in self.param_sets]
+        self.results = []
+
+    def run(self):
+        logger.info(
+            f"Iniciando varredura de parâmetros ({len(self.param_sets)} configurações)."
+        )
+        rows = [
+            dict(run_id=i, random_seed=seed, **params)
+            for i, (params, seed) in enumerate(zip(self.param_sets, self.seeds))
+        ]
+
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            active_ids = list(range(len(rows)))
+            for rung, gen_budget in enumerate(self.get_gen_budgets()):
+                logger.info(
+                    f"Etapa {rung}: avaliando {len(active_ids)} configurações com até {gen_budget} gerações."
+                )
+                run_args = [
+                    (
+                        self.config_file,
+                        self.f_obj,
+                        self.h_const,
+                        self.g_const,
+                        {
+                            **RUN_OVERRIDES,
+                            **self.param_sets[i],
+                            "random_seed": rows[i]["random_seed"],
+                            "max_gen": gen_budget,
+                        },
+                    )
+                    for i in active_ids
+                ]
+                for i, run_results in zip(
+                    active_ids, executor.map(run_config, run_args)
+                ):
+                    rows[i].update(run_results, rung=rung, gen_budget=gen_budget)
+                    if run_results["error"] is not None:
+                        logger.error(
+                            f"Falha na execução da configuração {i} ({run_results['error']})."
+                        )
+
+                # Halving sucessivo: apenas as melhores configurações seguem para a próxima etapa
+                active_ids = sorted(active_ids, key=lambda i: -rows[i]["best_f"])
+                active_ids = active_ids[
+                    : int(np.ceil(len(active_ids) / self.halving_eta))
+                ]
+
+        self.results = sorted(rows, key=lambda row: (-row["rung"], -row["best_f"]))
+        logger.info(
+            f"Varredura concluída. Melhor fitness: {self.results[0]['best_f']} "
+            f"(configuração {self.results[0]['run_id']})."
+        )
+        return self.results
+
+    def get_gen_budgets(self):
+        if self.halving_min_gen is None or self.halving_min_gen >= self.max_gen:
+            return [self.max_gen]
+
+        gen_budgets = [self.halving_min_gen]
+        while gen_budgets[-1] * self.halving_eta < self.max_gen:
+            gen_budgets.append(gen_budgets[-1] * self.halving_eta)
+
+        # A última etapa geométrica (exceto a primeira) é substituída por max_gen quando estão separadas por menos
+        # de um fator halving_eta (cada etapa reinicia as execuções da geração 0, de modo que etapas com orçamentos
+        # próximos repetiriam quase todo o trabalho)
+        if len(gen_budgets) > 1 and gen_budgets[-1] * self.halving_eta > self.max_gen:
+            gen_budgets[-1] = self.max_gen
+        else:
+            gen_budgets.append(self.max_gen)
+        return gen_budgets
+
+    def save_results(self, csv_file_name):
+        if not self.results:
+            raise RuntimeError(
+                "Nenhum resultado disponível. Execute a varredura antes."
+            )
+
+        field_names = list(self.results[0].keys())
+        for row in self.results[1:]:
+            field_names += [name for name in row.keys() if name not in field_names]
+
+        with open(csv_file_name, "w", newline="") as csv_file:
+            writer = csv.DictWriter(csv_file, fieldnames=field_names)
+            writer.writeheader()
+            writer.writerows(self.results)
@@ -0,0 +1,61 @@
+import os
+import threading
+import time
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from lumos.aux.evaluation_backends import (
+    close_executors,
+    get_available_evaluation_backends,
+    split_rows,
+)
+
+
+def thread_id(x):
+    time.sleep(0.01)
+    return threading.get_ident()
+
+
+def process_id(x):
+    time.sleep(0.01)
+    return os.getpid()
+
+
+def build_ga_data(f_obj, chunk_size=None, workers=4):
+    return SimpleNamespace(
+        f_obj=f_obj,
+        evaluation_chunk_size=chunk_size,
+        evaluation_workers=workers,
+        evaluation_executors={},
+    )
+
+
+@pytest.mark.parametrize(
+    "n, chunk_size, workers, chunk_lens",
+    [
+        (10, None, 4, [3, 3, 3, 1]),
+        (10, None, 1, [10]),
+        (3, None, 4, [1, 1, 1]),
+        (10, 4, 2, [4, 4, 2]),
+    ],
+)
+def test_split_rows(n, chunk_size, workers, chunk_lens):
+    chunks = split_rows(np.zeros((n, 2)), chunk_size, workers)
+    assert [chunk.shape[0] for chunk in chunks] == chunk_lens
+
+
+@pytest.mark.parametrize(
+    "kind, f_obj", [("thread", thread_id), ("process", process_id)]
+)
+def test_explicit_pool_backends_split_the_work(kind, f_obj):
+    ga_data = build_ga_data(f_obj)
+    try:
+        ids = get_available_evaluation_backends()[kind](ga_data, np.zeros((40, 2)))
+    finally:
+        close_executors(ga_data)
+
+    # Cada lote é avaliado por um único worker: com 4 lotes, mais de um worker deve ter sido empregado
+    assert ids.shape == (40,)
+    assert len(np.unique(ids)) > 1
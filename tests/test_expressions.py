@@ -0,0 +1,132 @@
+import importlib.util
+import os
+import time
+
+import numpy as np
+import pytest
+
+from lumos.aux.configs import Configs
+from lumos.aux.expressions import Problem
+
+
+EXAMPLES_DIR = os.path.join(os.path.dirname(__file__), "..", "examples", "finance")
+
+
+def build_problem(x_len=2, **problem):
+    return Problem(Configs({"x_len": x_len, "problem": {"f_obj": "x[0]", **problem}}))
+
+
+def load_finance_module():
+    spec = importlib.util.spec_from_file_location(
+        "finance", os.path.join(EXAMPLES_DIR, "finance.py")
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "x.__class__",
+        "(lambda: 1)()",
+        "x[0] if x[1] else 1",
+        "sqrt",
+        "x[5]",
+        "x[-1]",
+        "x[True]",
+        "x[0:1]",
+        "x",
+        "y + 1",
+        "__import__('os')",
+        "open('file')",
+        "sqrt(x[0], out=x)",
+        "'text'",
+        "x[0] ** 'a'",
+        "x[0] ** 1000",
+        "x[0] ** -101",
+        "x[0] < 1",
+        "not x[0]",
+        "[x[0]]",
+        "x[0] +",
+    ],
+)
+def test_rejected_expressions(expression):
+    with pytest.raises(RuntimeError):
+        build_problem(f_obj=expression)
+
+
+@pytest.mark.parametrize(
+    "constants",
+    [
+        {"c": "x[0]"},
+        {"c": "x"},
+        {"c": "d + 1"},
+        {"c": "9**9**7"},
+        {"x": "1"},
+        {"sqrt": "1"},
+        {"_c": "1"},
+    ],
+)
+def test_rejected_constants(constants):
+    start = time.perf_counter()
+    with pytest.raises(RuntimeError):
+        build_problem(constants=constants)
+    assert time.perf_counter() - start < 1
+
+
+def test_huge_power_does_not_hang():
+    start = time.perf_counter()
+    problem = build_problem(f_obj="x[0] + 9**9**9")
+    with np.errstate(all="ignore"):
+        assert np.isinf(problem.f_obj([1.0, 2.0]))
+    assert time.perf_counter() - start < 1
+
+
+def test_constants_and_variables():
+    problem = build_problem(
+        variables=["a", "b"],
+        f_obj="k * a + b ** 2 - pi",
+        constants={"c": 2, "k": "c * 3"},
+    )
+    assert problem.f_obj([1.0, 2.0]) == pytest.approx(6.0 + 4.0 - np.pi)
+
+
+def test_single_constraint_as_text():
+    problem = build_problem(
+        variables=["w_1", "w_2"], h_const="w_1 + w_2 - 1", g_const="-w_1"
+    )
+    assert problem.h_const_expressions == ["w_1 + w_2 - 1"]
+    assert problem.h_const([0.25, 0.5]) == pytest.approx([-0.25])
+    assert problem.g_const([0.25, 0.5]) == pytest.approx([-0.25])
+
+
+def test_invalid_constraint_type():
+    with pytest.raises(RuntimeError, match="lista de expressões"):
+        build_problem(h_const=1)
+
+
+def test_common_subexpressions_are_computed_once():
+    problem = build_problem(
+        f_obj="sqrt(x[0] * x[1]) + 1", g_const=["sqrt(x[0] * x[1]) - 2"]
+    )
+    assert problem.source.count("sqrt(") == 1
+    f_value, _, g_values = problem.evaluate([4.0, 4.0])
+    assert f_value == pytest.approx(5.0)
+    assert g_values == pytest.approx([2.0])
+
+
+def test_declarative_finance_matches_python():
+    finance = load_finance_module()
+    problem = Problem(
+        Configs(os.path.join(EXAMPLES_DIR, "configs_finance_declarative.toml"))
+    )
+    pop = np.random.default_rng(0).random((50, 2))
+
+    f_values, h_values, g_values = problem.evaluate(pop.T)
+    np.testing.assert_allclose(f_values, [finance.f_obj(x) for x in pop])
+    np.testing.assert_allclose(h_values.T, [finance.h_const(x) for x in pop])
+    np.testing.assert_allclose(g_values.T, [finance.g_const(x) for x in pop])
+
+    for x in pop[:5]:
+        assert problem.f_obj(x) == pytest.approx(finance.f_obj(x))
@@ -0,0 +1,95 @@
+import threading
+
+import numpy as np
+import pytest
+
+from lumos.ga import Ga
+
+
+CONFIG = {
+    "max_gen": 5,
+    "pop_len": 200,
+    "x_len": 2,
+    "mutation_rate": 0.1,
+    "random_seed": 0,
+    "select_method": "roulette",
+    "cross_method": "arithmetic_recombination",
+    "mut_method": "nonuniform_gaussian",
+    "gene_type": "real",
+    "x_l": [-3.0, -1.0],
+    "x_u": [3.0, 1.0],
+    "max_exec_time_seconds": 60,
+    "min_f_obj_value_diff": 1e-10,
+    "generations_to_check_f_obj_diff": 100,
+    "log_level": None,
+    "plot_f_obj_history": False,
+    "f_obj_history_path": False,
+    "crossover": {"alpha": 0.3},
+    "mutation": {"reduce_mut_factor": 6},
+}
+
+# Orçamento de memória que resulta em lotes de 10 indivíduos (13 valores por indivíduo)
+CHUNKED = {"memory_budget_mb": 10 * 8 * 13 * 16 / 2**20}
+
+
+def f_obj(x):
+    return -((x[0] - 1) ** 2) - x[1] ** 2
+
+
+def g_const(x):
+    return [x[0] - 10 - k for k in range(10)]
+
+
+class RecordingGa(Ga):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lock = threading.Lock()
+        self.prepared = 0
+        self.max_prefetch = 0
+
+    def get_f_obj_values(self, pop):
+        self.prepared = 0
+        return super().get_f_obj_values(pop)
+
+    def prepare_chunk(self, pop, chunk, *args):
+        with self.lock:
+            self.prepared += 1
+        super().prepare_chunk(pop, chunk, *args)
+
+    def evaluate_chunk(self, pop, chunk, *args):
+        # Número de lotes preparados além do lote em avaliação
+        with self.lock:
+            self.max_prefetch = max(
+                self.max_prefetch, self.prepared - (chunk.start // 10 + 1)
+            )
+        super().evaluate_chunk(pop, chunk, *args)
+
+
+def optimize(overrides, ga_class=Ga):
+    ga = ga_class(CONFIG, f_obj, g_const=g_const, config_overrides=overrides)
+    return ga, ga.optimize()
+
+
+def test_chunks_include_python_constraints():
+    ga, _ = optimize({**CHUNKED, "evaluation_backend": "serial"})
+    assert ga.constraints_len == 10
+    assert len(ga.get_chunks(ga.pop)) == 20
+
+
+@pytest.mark.parametrize("overlap_chunks", [False, True])
+def test_chunked_evaluation_matches_single_chunk(overlap_chunks):
+    _, expected = optimize({"evaluation_backend": "serial"})
+    _, results = optimize(
+        {**CHUNKED, "overlap_chunks": overlap_chunks, "evaluation_backend": "serial"}
+    )
+    assert results["best_f"] == expected["best_f"]
+    np.testing.assert_array_equal(results["best_x"], expected["best_x"])
+    assert results["f_calls"] == expected["f_calls"]
+
+
+def test_overlap_prefetches_a_single_chunk():
+    ga, _ = optimize(
+        {**CHUNKED, "overlap_chunks": True, "evaluation_backend": "serial"},
+        RecordingGa,
+    )
+    assert ga.max_prefetch <= 1
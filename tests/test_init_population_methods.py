@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from lumos.genetic_operators.init_population_methods import load_population
+
+
+POP = np.arange(12, dtype=float).reshape(4, 3)
+
+
+def test_load_npy(tmp_path):
+    file_name = str(tmp_path / "pop.npy")
+    np.save(file_name, POP)
+    np.testing.assert_array_equal(load_population(file_name), POP)
+
+
+def test_load_npz_with_pop_key(tmp_path):
+    file_name = str(tmp_path / "pop.npz")
+    np.savez(file_name, pop=POP, f_obj_values=np.zeros(4))
+    np.testing.assert_array_equal(load_population(file_name), POP)
+
+
+def test_load_npz_with_single_array(tmp_path):
+    file_name = str(tmp_path / "pop.npz")
+    np.savez(file_name, POP)
+    np.testing.assert_array_equal(load_population(file_name), POP)
+
+
+def test_load_npz_with_ambiguous_arrays(tmp_path):
+    file_name = str(tmp_path / "pop.npz")
+    np.savez(file_name, POP, np.zeros(4))
+    with pytest.raises(RuntimeError, match='chave "pop"'):
+        load_population(file_name)
+
+
+def test_load_csv(tmp_path):
+    file_name = str(tmp_path / "pop.csv")
+    np.savetxt(file_name, POP, delimiter=",")
+    np.testing.assert_array_equal(load_population(file_name), POP)
@@ -0,0 +1,84 @@
+import threading
+
+import pytest
+
+from lumos.service import OptimizationService, check_host, handle_line
+
+
+CONFIG = {
+    "max_gen": 20,
+    "pop_len": 20,
+    "x_len": 2,
+    "mutation_rate": 0.1,
+    "random_seed": 0,
+    "select_method": "roulette",
+    "cross_method": "arithmetic_recombination",
+    "mut_method": "nonuniform_gaussian",
+    "gene_type": "real",
+    "x_l": [-3.0, -1.0],
+    "x_u": [3.0, 1.0],
+    "max_exec_time_seconds": 60,
+    "min_f_obj_value_diff": 1e-10,
+    "generations_to_check_f_obj_diff": 100,
+    "crossover": {"alpha": 0.3},
+    "mutation": {"reduce_mut_factor": 6},
+}
+
+
+def f_obj(x):
+    return -((x[0] - 1) ** 2) - x[1] ** 2
+
+
+@pytest.fixture(scope="module")
+def service():
+    service = OptimizationService(max_workers=1, log_level=None)
+    yield service
+    service.shutdown()
+
+
+def submit(service, job_id, **request):
+    events = []
+    finished = threading.Event()
+
+    def send(event):
+        events.append(event)
+        if event["event"] in ("done", "cancelled", "error"):
+            finished.set()
+
+    service.handle(
+        {"cmd": "submit", "job_id": job_id, "config": CONFIG, **request}, send
+    )
+    assert finished.wait(60)
+    return events
+
+
+def test_progress_events_precede_final_event(service):
+    events = submit(service, "ordered", f_obj="test_service:f_obj")
+
+    assert events[0] == {"event": "accepted", "job_id": "ordered"}
+    assert events[-1]["event"] == "done"
+    gens = [event["gen"] for event in events if event["event"] == "progress"]
+    assert gens == list(range(events[-1]["results"]["max_gen"] + 1))
+
+
+def test_failed_job_reports_error(service):
+    events = submit(service, "failed", f_obj="missing_module:f_obj")
+    assert [event["event"] for event in events] == ["accepted", "error"]
+
+
+@pytest.mark.parametrize("line", ["[1, 2]", '"text"', "1", "{invalid"])
+def test_invalid_messages_are_answered(service, line):
+    events = []
+    assert handle_line(service, line, events.append)
+    assert events[0]["event"] == "error"
+
+
+@pytest.mark.parametrize("host", ["127.0.0.1", "localhost", "::1"])
+def test_loopback_hosts_are_accepted(host):
+    check_host(host)
+
+
+@pytest.mark.parametrize("host", ["0.0.0.0", "8.8.8.8", "host.invalid"])
+def test_other_hosts_are_rejected(host):
+    with pytest.raises(RuntimeError, match="loopback"):
+        check_host(host)
@@ -0,0 +1,62 @@
+import os
+
+import pytest
+import toml
+
+from lumos.sweep import Sweep
+
+
+CONFIG_FILE = os.path.join(
+    os.path.dirname(__file__), "..", "examples", "finance", "configs_finance.toml"
+)
+
+
+def f_obj(x):
+    return -(x[0] ** 2) - x[1] ** 2
+
+
+def build_sweep(param_grid=None, **configs):
+    return Sweep(
+        {**toml.load(CONFIG_FILE), **configs},
+        f_obj,
+        param_grid=param_grid or {"crossover.alpha": [0.2, 0.3]},
+        random_seed=0,
+    )
+
+
+@pytest.mark.parametrize(
+    "max_gen, halving_min_gen, gen_budgets",
+    [
+        (30, 3, [3, 9, 30]),
+        (81, 3, [3, 9, 27, 81]),
+        (200, 5, [5, 15, 45, 200]),
+        (35, 12, [12, 35]),
+        (35, 20, [20, 35]),
+        (35, 35, [35]),
+        (35, None, [35]),
+    ],
+)
+def test_gen_budgets(max_gen, halving_min_gen, gen_budgets):
+    sweep = build_sweep(max_gen=max_gen)
+    sweep.halving_min_gen = halving_min_gen
+    assert sweep.get_gen_budgets() == gen_budgets
+
+
+def test_grouped_param_is_accepted():
+    sweep = build_sweep({"crossover.alpha": [0.2, 0.3], "pop_len": [20, 40]})
+    assert len(sweep.param_sets) == 4
+
+
+@pytest.mark.parametrize(
+    "param_grid",
+    [{"crosover.alpha": [0.2]}, {"crossover.alfa": [0.2]}, {"pop_size": [20]}],
+)
+def test_unknown_param_is_rejected(param_grid):
+    with pytest.raises(RuntimeError, match="não foram encontrados"):
+        build_sweep(param_grid)
+
+
+@pytest.mark.parametrize("name", ["max_gen", "random_seed", "run_id"])
+def test_reserved_param_is_rejected(name):
+    with pytest.raises(RuntimeError, match="definidos pela varredura"):
+        build_sweep({name: [1, 2]})